@@ -3,6 +3,12 @@ import time
 import sys
 import itertools
 import random
+import bisect
+import cProfile
+import io
+import pstats
+import tracemalloc
+from contextlib import contextmanager
 from datetime import datetime
 from typing import List, Set, Dict, Tuple
 import string
@@ -35,6 +41,138 @@ def print_banner():
     """
     print(banner)
 
+class RunProfiler:
+    """Collect per-stage timings, counters and memory usage for a generation run."""
+
+    def __init__(self, use_cprofile: bool = False, use_tracemalloc: bool = False):
+        self.enabled: bool = False
+        self.use_cprofile = use_cprofile
+        self.use_tracemalloc = use_tracemalloc
+        self.stages: Dict[str, Dict[str, float]] = {}
+        self.total_time: float = 0.0
+        self._start_time: float = 0.0
+        self._cprofile = None
+        self._owns_tracemalloc: bool = False
+        self._open_stages: List[Dict[str, float]] = []
+        self._stage_base: Dict[str, int] = {}
+
+    def _get_stage(self, name: str) -> Dict[str, float]:
+        """Return the record for a stage, creating it if needed."""
+        return self.stages.setdefault(name, {
+            "calls": 0, "time": 0.0, "net_kb": 0.0, "peak_kb": 0.0
+        })
+
+    def start(self) -> None:
+        """Start profiling a run, attaching cProfile and tracemalloc if requested."""
+        self.enabled = True
+        self.stages = {}
+        self._open_stages = []
+        self._stage_base = {}
+        self._cprofile = None
+        # Leave tracing alone if the caller had already enabled it
+        self._owns_tracemalloc = self.use_tracemalloc and not tracemalloc.is_tracing()
+        if self._owns_tracemalloc:
+            tracemalloc.start()
+        if self.use_cprofile:
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+        self._start_time = time.perf_counter()
+
+    def stop(self) -> None:
+        """Stop profiling and detach cProfile and tracemalloc."""
+        if not self.enabled:
+            return
+        self.total_time = time.perf_counter() - self._start_time
+        if self._cprofile:
+            self._cprofile.disable()
+        if self._owns_tracemalloc:
+            tracemalloc.stop()
+            self._owns_tracemalloc = False
+        self.enabled = False
+
+    @contextmanager
+    def stage(self, name: str):
+        """Time a pipeline stage and record its memory usage.
+
+        Memory is measured from the traced level when the stage was first
+        entered, so for a stage that runs several times ``net_kb`` is what is
+        still held after its latest call and ``peak_kb`` the highest level
+        reached during any call; net can therefore never exceed peak. Stages
+        may be nested: time spent in an inner stage is not counted again in
+        the outer one, while memory used by the inner stage is included in
+        the outer stage's net and peak.
+        """
+        if not self.enabled:
+            yield
+            return
+
+        stage = self._get_stage(name)
+        frame = {"child_time": 0.0, "peak": 0}
+        if self.use_tracemalloc:
+            if self._open_stages:
+                parent = self._open_stages[-1]
+                parent["peak"] = max(parent["peak"], tracemalloc.get_traced_memory()[1])
+            if hasattr(tracemalloc, "reset_peak"):
+                tracemalloc.reset_peak()
+            mem_base = self._stage_base.setdefault(name, tracemalloc.get_traced_memory()[0])
+        self._open_stages.append(frame)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self._open_stages.pop()
+            stage["calls"] += 1
+            stage["time"] += elapsed - frame["child_time"]
+            if self._open_stages:
+                self._open_stages[-1]["child_time"] += elapsed
+            if self.use_tracemalloc:
+                current, peak = tracemalloc.get_traced_memory()
+                peak = max(peak, frame["peak"])
+                stage["net_kb"] = (current - mem_base) / 1024
+                stage["peak_kb"] = max(stage["peak_kb"], (peak - mem_base) / 1024)
+                if self._open_stages:
+                    parent = self._open_stages[-1]
+                    parent["peak"] = max(parent["peak"], peak)
+
+    def count(self, name: str, counter: str, value: int) -> None:
+        """Add a value to a counter attached to a stage."""
+        if not self.enabled:
+            return
+        stage = self._get_stage(name)
+        stage[counter] = stage.get(counter, 0) + value
+
+    def report(self) -> str:
+        """Build a text report of the per-stage breakdown."""
+        lines = [f"Total run time: {self.total_time:.4f}s", ""]
+        lines.append(f"{'Stage':<16}{'Calls':>8}{'Time (s)':>12}{'%':>8}"
+                     f"{'Net (KB)':>14}{'Peak (KB)':>14}  Counters")
+        for name, stage in self.stages.items():
+            share = (stage["time"] / self.total_time * 100) if self.total_time else 0
+            counters = ", ".join(f"{key}={value}" for key, value in stage.items()
+                                 if key not in ("calls", "time", "net_kb", "peak_kb"))
+            if self.use_tracemalloc:
+                memory = f"{stage['net_kb']:>14.2f}{stage['peak_kb']:>14.2f}"
+            else:
+                memory = f"{'-':>14}{'-':>14}"
+            lines.append(f"{name:<16}{stage['calls']:>8}{stage['time']:>12.4f}"
+                         f"{share:>7.1f}%{memory}  {counters}")
+
+        if self._cprofile:
+            output = io.StringIO()
+            pstats.Stats(self._cprofile, stream=output).sort_stats("cumulative").print_stats(20)
+            lines.extend(["", "cProfile (top 20 by cumulative time):", output.getvalue()])
+
+        return "\n".join(lines) + "\n"
+
+    def save_report(self, directory: str) -> str:
+        """Write the report to a file and return the filename."""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = os.path.join(directory, f"profile_{timestamp}.txt")
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.write(self.report())
+        return filename
+
 class WordlistGenerator:
     def __init__(self):
         self.keywords: List[str] = []
@@ -43,7 +181,9 @@ class WordlistGenerator:
         self.max_combinations: int = 1000000
         self.min_length: int = 1
         self.max_length: int = 20
+        self.hybrid_batch_size: int = 100000
         self.language: str = "FR"
+        self.profiler = RunProfiler()
         
         # Create necessary directories
         self.source_dir = "source"
@@ -63,6 +203,7 @@ class WordlistGenerator:
             's': '$', 't': '7', 'b': '8', 'g': '9',
             'l': '1', 'z': '2'
         }
+        self.leet_table = str.maketrans(self.leet_map)
 
     def _create_directories(self):
         """Create necessary directories if they don't exist."""
@@ -84,29 +225,31 @@ class WordlistGenerator:
         numbers = ['123', '456', '789', '000', '111', '222', '333']
         special_chars = ['!', '@', '#', '$', '%', '&', '*']
         
-        while len(words) < word_count:
-            # Generate a random word combination
-            word = random.choice(base_words)
-            if random.random() > 0.5:
-                word += random.choice(numbers)
-            if random.random() > 0.7:
-                word += random.choice(special_chars)
+        with self.profiler.stage("auto_generate"):
+            while len(words) < word_count:
+                # Generate a random word combination
+                word = random.choice(base_words)
+                if random.random() > 0.5:
+                    word += random.choice(numbers)
+                if random.random() > 0.7:
+                    word += random.choice(special_chars)
             
-            # Add variations
-            words.add(word)
-            words.add(word.upper())
-            words.add(word.capitalize())
-            words.add(self.to_leet(word))
+                # Add variations
+                words.add(word)
+                words.add(word.upper())
+                words.add(word.capitalize())
+                words.add(self.to_leet(word))
             
-            # Add reversed versions
-            if random.random() > 0.8:
-                words.add(word[::-1])
+                # Add reversed versions
+                if random.random() > 0.8:
+                    words.add(word[::-1])
             
-            # Combine two words
-            if random.random() > 0.6:
-                word2 = random.choice(base_words)
-                words.add(word + word2)
-                words.add(word2 + word)
+                # Combine two words
+                if random.random() > 0.6:
+                    word2 = random.choice(base_words)
+                    words.add(word + word2)
+                    words.add(word2 + word)
+        self.profiler.count("auto_generate", "words", len(words))
         
         return set(list(words)[:word_count])
 
@@ -127,29 +270,33 @@ class WordlistGenerator:
 
     def to_leet(self, word: str) -> str:
         """Convert a word to leet speak."""
-        result = ""
-        for char in word.lower():
-            result += self.leet_map.get(char, char)
-        return result
+        return word.lower().translate(self.leet_table)
 
     def generate_variations(self, word: str) -> Set[str]:
         """Generate variations of a word including leet speak and reverse."""
-        variations = {word}
-        
-        # Add lowercase and uppercase variations
-        variations.add(word.lower())
-        variations.add(word.upper())
-        variations.add(word.capitalize())
-        
-        # Add leet speak variations
-        leet = self.to_leet(word)
-        variations.add(leet)
-        
-        # Add reversed variations
-        variations.add(word[::-1])
-        variations.add(leet[::-1])
-        
-        return variations
+        return set(self.generate_variations_batch([word]))
+
+    def generate_variations_batch(self, words: List[str]) -> List[str]:
+        """Generate variations for a whole block of words at once.
+
+        Each transformation (case, leet speak, reverse) is applied to the
+        full block as one column, then all columns are merged into a single
+        list without duplicates. Deduplication keeps first-seen order so the
+        element order, and therefore which words survive the
+        ``max_combinations`` cut-off, is the same on every run.
+        """
+        lower = list(map(str.lower, words))
+        leet = [word.translate(self.leet_table) for word in lower]
+        columns = (
+            words,
+            lower,
+            map(str.upper, words),
+            map(str.capitalize, words),
+            leet,
+            (word[::-1] for word in words),
+            (word[::-1] for word in leet),
+        )
+        return list(dict.fromkeys(itertools.chain.from_iterable(columns)))
 
     def import_wordlist(self, filepath: str) -> None:
         """Import words from an existing wordlist file."""
@@ -177,23 +324,21 @@ class WordlistGenerator:
 
     def generate_wordlist(self, advanced_mode: bool = False) -> Set[str]:
         """Generate the complete wordlist."""
-        base_words = set()
-        
         # Add base keywords and their variations
-        for keyword in self.keywords:
+        with self.profiler.stage("variations"):
             if advanced_mode:
-                base_words.update(self.generate_variations(keyword))
+                elements = self.generate_variations_batch(self.keywords)
             else:
-                base_words.add(keyword)
+                elements = list(dict.fromkeys(self.keywords))
 
         # Generate combinations with numbers and special characters
         combinations = set()
-        elements = list(base_words)
         
         if self.numbers:
             elements.extend(self.numbers)
         if self.special_chars:
             elements.extend(self.special_chars)
+        self.profiler.count("variations", "elements", len(elements))
 
         # Show progress animation
         total_combinations = sum(1 for _ in range(self.min_length, min(self.max_length + 1, len(elements) + 1)))
@@ -207,13 +352,15 @@ class WordlistGenerator:
             sys.stdout.write(f"\r[{'=' * progress}{' ' * (20-progress)}] {current}/{total_combinations}")
             sys.stdout.flush()
             
-            for combo in itertools.permutations(elements, length):
-                if len(combinations) >= self.max_combinations:
-                    break
-                word = ''.join(combo)
-                if self.min_length <= len(word) <= self.max_length:
-                    combinations.add(word)
+            with self.profiler.stage("permutations"):
+                for combo in itertools.permutations(elements, length):
+                    if len(combinations) >= self.max_combinations:
+                        break
+                    word = ''.join(combo)
+                    if self.min_length <= len(word) <= self.max_length:
+                        combinations.add(word)
 
+        self.profiler.count("permutations", "words", len(combinations))
         print("\n")
         return combinations
 
@@ -232,20 +379,120 @@ class WordlistGenerator:
         """Save the wordlist to a file and return the filename and statistics."""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = os.path.join(self.output_dir, f"wordlist_{timestamp}.txt")
-        stats = self.get_statistics(wordlist)
+        with self.profiler.stage("statistics"):
+            stats = self.get_statistics(wordlist)
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            for word in sorted(wordlist):
-                f.write(f"{word}\n")
+        with self.profiler.stage("sort"):
+            sorted_words = sorted(wordlist)
+
+        with self.profiler.stage("write"):
+            with open(filename, 'w', encoding='utf-8') as f:
+                for word in sorted_words:
+                    f.write(f"{word}\n")
+        self.profiler.count("write", "lines", len(sorted_words))
                 
         if preview:
             print("\n\033[36mAperçu des 10 premiers mots :\033[0m" if self.language == "FR" 
                   else "\n\033[36mPreview of first 10 words:\033[0m")
-            for word in sorted(list(wordlist))[:10]:
+            for word in sorted_words[:10]:
                 print(f"\033[33m{word}\033[0m")
                 
         return filename, stats
 
+    def build_affixes(self) -> List[str]:
+        """Build affixes as the cross product of the number and special character slots."""
+        slots = [[""] + self.numbers, [""] + self.special_chars]
+        return list(dict.fromkeys(''.join(combo) for combo in itertools.product(*slots)))
+
+    def generate_hybrid(self, filepath: str, position: str = "suffix",
+                        preview: bool = False) -> Tuple[str, Dict[str, any]]:
+        """Stream a source wordlist and combine each word with generated prefixes/suffixes.
+
+        Words are written in batches of ``hybrid_batch_size`` without being kept
+        in memory, so the output is in corpus order rather than sorted.
+        Duplicates built from a single corpus line are removed, but duplicates
+        across lines (e.g. ``password`` + ``1`` and a corpus entry ``password1``)
+        are kept on purpose and are included in the returned statistics.
+        """
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = os.path.join(self.output_dir, f"wordlist_{timestamp}.txt")
+        suffix = 1
+        while os.path.exists(filename):
+            filename = os.path.join(self.output_dir, f"wordlist_{timestamp}_{suffix}.txt")
+            suffix += 1
+
+        with self.profiler.stage("affixes"):
+            affixes = self.build_affixes()
+            prefixes = affixes if position in ("prefix", "both") else [""]
+            suffixes = affixes if position in ("suffix", "both") else [""]
+            # Sort pairs by added length so each word only slices the valid range
+            pairs = sorted(((p, s) for p in prefixes for s in suffixes),
+                           key=lambda pair: len(pair[0]) + len(pair[1]))
+            extra_lengths = [len(p) + len(s) for p, s in pairs]
+        self.profiler.count("affixes", "pairs", len(pairs))
+
+        total = 0
+        total_chars = 0
+        first_words: List[str] = []
+        batch: List[str] = []
+
+        try:
+            with self.profiler.stage("hybrid"):
+                with open(os.path.join(self.source_dir, filepath), 'r', encoding='utf-8',
+                          errors='surrogateescape') as src, \
+                        open(filename, 'w', encoding='utf-8', errors='surrogateescape') as out:
+                    for line in src:
+                        if total >= self.max_combinations:
+                            break
+                        word = line.strip()
+                        if not word:
+                            continue
+                        start = bisect.bisect_left(extra_lengths, self.min_length - len(word))
+                        end = bisect.bisect_right(extra_lengths, self.max_length - len(word))
+                        if start >= end:
+                            continue
+
+                        # Affixes such as "1" and "11" can build the same word twice
+                        words = list(dict.fromkeys([p + word + s for p, s in pairs[start:end]]))
+                        words = words[:self.max_combinations - total]
+                        total += len(words)
+                        total_chars += sum(map(len, words))
+                        if len(first_words) < 10:
+                            first_words.extend(words[:10 - len(first_words)])
+                        batch.extend(words)
+
+                        if len(batch) >= self.hybrid_batch_size:
+                            with self.profiler.stage("hybrid_write"):
+                                out.write('\n'.join(batch))
+                                out.write('\n')
+                            batch.clear()
+
+                    if batch:
+                        with self.profiler.stage("hybrid_write"):
+                            out.write('\n'.join(batch))
+                            out.write('\n')
+        except Exception:
+            # Don't leave a partial wordlist behind
+            if os.path.exists(filename):
+                os.remove(filename)
+            raise
+        self.profiler.count("hybrid", "words", total)
+
+        stats = {
+            "total_combinations": total,
+            "average_length": round(total_chars / total, 2) if total else 0,
+            "estimated_size_kb": round(total_chars / 1024, 2)
+        }
+
+        if preview:
+            print("\n\033[36mAperçu des 10 premiers mots :\033[0m" if self.language == "FR" 
+                  else "\n\033[36mPreview of first 10 words:\033[0m")
+            for word in first_words:
+                word = word.encode('utf-8', 'surrogateescape').decode('utf-8', 'replace')
+                print(f"\033[33m{word}\033[0m")
+
+        return filename, stats
+
 def display_menu(msgs, lang):
     """Display the main menu."""
     clear_screen()
@@ -280,7 +527,7 @@ def main():
 3. Voir les statistiques
 4. Quitter
 """,
-            "mode": "\n1. Mode Simple\n2. Mode Avancé\n3. Mode Auto\nChoisissez le mode (1/2/3): ",
+            "mode": "\n1. Mode Simple\n2. Mode Avancé\n3. Mode Auto\n4. Mode Hybride\nChoisissez le mode (1/2/3/4): ",
             "auto_words": "Nombre de mots à générer: ",
             "keyword_prompt": "Entrez un mot-clé (ou 'q' pour terminer): ",
             "number_prompt": "Entrez un nombre (ou 'q' pour terminer): ",
@@ -288,8 +535,12 @@ def main():
             "min_length": "Longueur minimum des combinaisons (défaut: 1): ",
             "max_length": "Longueur maximum des combinaisons (défaut: 20): ",
             "max_combinations": "Nombre maximum de combinaisons (défaut: 1000000): ",
+            "profiling": "Profilage (0: désactivé, 1: chronos, 2: + cProfile, 3: + cProfile et tracemalloc) (défaut: 0): ",
+            "profile_saved": "\033[32mRapport de profilage sauvegardé dans le fichier: \033[0m",
             "import_prompt": "Fichiers disponibles dans le dossier source:",
             "import_select": "Sélectionnez un fichier (numéro) ou 0 pour annuler: ",
+            "hybrid_position": "Position (1: suffixe, 2: préfixe, 3: les deux) (défaut: 1): ",
+            "hybrid_error": "\033[31m✗ Erreur lors de la génération hybride: \033[0m",
             "generating": "\033[32mGénération de la wordlist en cours...\033[0m",
             "saved": "\n\033[32mWordlist sauvegardée dans le fichier: \033[0m",
             "stats": """\n\033[36mStatistiques :\033[0m
@@ -306,7 +557,7 @@ def main():
 3. View statistics
 4. Quit
 """,
-            "mode": "\n1. Simple Mode\n2. Advanced Mode\n3. Auto Mode\nChoose mode (1/2/3): ",
+            "mode": "\n1. Simple Mode\n2. Advanced Mode\n3. Auto Mode\n4. Hybrid Mode\nChoose mode (1/2/3/4): ",
             "auto_words": "Number of words to generate: ",
             "keyword_prompt": "Enter a keyword (or 'q' to finish): ",
             "number_prompt": "Enter a number (or 'q' to finish): ",
@@ -314,8 +565,12 @@ def main():
             "min_length": "Minimum combination length (default: 1): ",
             "max_length": "Maximum combination length (default: 20): ",
             "max_combinations": "Maximum number of combinations (default: 1000000): ",
+            "profiling": "Profiling (0: off, 1: timers, 2: + cProfile, 3: + cProfile and tracemalloc) (default: 0): ",
+            "profile_saved": "\033[32mProfiling report saved to file: \033[0m",
             "import_prompt": "Available files in source directory:",
             "import_select": "Select a file (number) or 0 to cancel: ",
+            "hybrid_position": "Position (1: suffix, 2: prefix, 3: both) (default: 1): ",
+            "hybrid_error": "\033[31m✗ Error generating hybrid wordlist: \033[0m",
             "generating": "\033[32mGenerating wordlist...\033[0m",
             "saved": "\n\033[32mWordlist saved to file: \033[0m",
             "stats": """\n\033[36mStatistics:\033[0m
@@ -340,18 +595,113 @@ def main():
             if mode_choice == "3":  # Auto Mode
                 try:
                     word_count = int(input(msgs[lang]["auto_words"]))
+
+                    try:
+                        profiling = int(input(msgs[lang]["profiling"]))
+                    except ValueError:
+                        profiling = 0
+                    generator.profiler = RunProfiler(use_cprofile=profiling >= 2,
+                                                     use_tracemalloc=profiling >= 3)
+
                     print(msgs[lang]["generating"])
-                    wordlist = generator.auto_generate(word_count)
-                    filename, stats = generator.save_wordlist(wordlist, preview=True)
+                    try:
+                        if profiling > 0:
+                            generator.profiler.start()
+                        wordlist = generator.auto_generate(word_count)
+                        filename, stats = generator.save_wordlist(wordlist, preview=True)
+                    finally:
+                        generator.profiler.stop()
                     print(f"{msgs[lang]['saved']}{filename}")
                     print(msgs[lang]["stats"].format(
                         stats["total_combinations"],
                         stats["average_length"],
                         stats["estimated_size_kb"]
                     ))
+
+                    if profiling > 0:
+                        report_file = generator.profiler.save_report(generator.output_dir)
+                        print(f"{msgs[lang]['profile_saved']}{report_file}")
                 except ValueError:
                     print("\033[31mErreur: Veuillez entrer un nombre valide.\033[0m" if lang == "FR"
                           else "\033[31mError: Please enter a valid number.\033[0m")
+            elif mode_choice == "4":  # Hybrid Mode
+                files = generator.get_source_files()
+                print(f"\n{msgs[lang]['import_prompt']}")
+                source_file = None
+                if files:
+                    for i, file in enumerate(files, 1):
+                        print(f"{i}. {file}")
+                    try:
+                        file_choice = int(input(f"\n{msgs[lang]['import_select']}"))
+                        if 0 < file_choice <= len(files):
+                            source_file = files[file_choice - 1]
+                    except ValueError:
+                        pass
+                else:
+                    print("\033[33mAucun fichier trouvé dans le dossier source.\033[0m" if lang == "FR"
+                          else "\033[33mNo files found in source directory.\033[0m")
+
+                if source_file:
+                    position = {"2": "prefix", "3": "both"}.get(
+                        input(msgs[lang]["hybrid_position"]), "suffix")
+
+                    print("\n\033[36m[ Numbers ]\033[0m")
+                    while True:
+                        number = input(msgs[lang]["number_prompt"])
+                        if number.lower() == 'q':
+                            break
+                        generator.add_number(number)
+
+                    print("\n\033[36m[ Special Characters ]\033[0m")
+                    while True:
+                        char = input(msgs[lang]["special_prompt"])
+                        if char.lower() == 'q':
+                            break
+                        generator.add_special_char(char)
+
+                    print("\n\033[36m[ Configuration ]\033[0m")
+                    try:
+                        generator.min_length = int(input(msgs[lang]["min_length"]))
+                    except ValueError:
+                        pass
+
+                    try:
+                        generator.max_length = int(input(msgs[lang]["max_length"]))
+                    except ValueError:
+                        pass
+
+                    try:
+                        generator.max_combinations = int(input(msgs[lang]["max_combinations"]))
+                    except ValueError:
+                        pass
+
+                    try:
+                        profiling = int(input(msgs[lang]["profiling"]))
+                    except ValueError:
+                        profiling = 0
+                    generator.profiler = RunProfiler(use_cprofile=profiling >= 2,
+                                                     use_tracemalloc=profiling >= 3)
+
+                    print(msgs[lang]["generating"])
+                    try:
+                        try:
+                            if profiling > 0:
+                                generator.profiler.start()
+                            filename, stats = generator.generate_hybrid(source_file, position, preview=True)
+                        finally:
+                            generator.profiler.stop()
+                        print(f"{msgs[lang]['saved']}{filename}")
+                        print(msgs[lang]["stats"].format(
+                            stats["total_combinations"],
+                            stats["average_length"],
+                            stats["estimated_size_kb"]
+                        ))
+
+                        if profiling > 0:
+                            report_file = generator.profiler.save_report(generator.output_dir)
+                            print(f"{msgs[lang]['profile_saved']}{report_file}")
+                    except Exception as e:
+                        print(f"{msgs[lang]['hybrid_error']}{str(e)}")
             else:  # Simple or Advanced Mode
                 advanced_mode = mode_choice == "2"
                 
@@ -394,16 +744,32 @@ def main():
                     generator.max_combinations = max_comb
                 except ValueError:
                     pass
+
+                try:
+                    profiling = int(input(msgs[lang]["profiling"]))
+                except ValueError:
+                    profiling = 0
+                generator.profiler = RunProfiler(use_cprofile=profiling >= 2,
+                                                 use_tracemalloc=profiling >= 3)
                 
                 print(msgs[lang]["generating"])
-                wordlist = generator.generate_wordlist(advanced_mode)
-                filename, stats = generator.save_wordlist(wordlist, preview=True)
+                try:
+                    if profiling > 0:
+                        generator.profiler.start()
+                    wordlist = generator.generate_wordlist(advanced_mode)
+                    filename, stats = generator.save_wordlist(wordlist, preview=True)
+                finally:
+                    generator.profiler.stop()
                 print(f"{msgs[lang]['saved']}{filename}")
                 print(msgs[lang]["stats"].format(
                     stats["total_combinations"],
                     stats["average_length"],
                     stats["estimated_size_kb"]
                 ))
+
+                if profiling > 0:
+                    report_file = generator.profiler.save_report(generator.output_dir)
+                    print(f"{msgs[lang]['profile_saved']}{report_file}")
             
             input("\n\033[32mAppuyez sur Entrée pour continuer...\033[0m")
             